@@ -1,5 +1,6 @@
-from queue import deque
+import re
 from enum import Enum
+from itertools import islice
 
 class BONType(Enum):
     """
@@ -12,65 +13,124 @@ class BONType(Enum):
     bon_node = 5
     invalid = 6
 
-class TextQueue(deque):
+#Character codes used by the parser, which works on the UTF-8 encoded source
+_LBRACE, _RBRACE = ord('{'), ord('}')
+_LBRACK, _RBRACK = ord('['), ord(']')
+_COLON, _SEMI, _COMMA = ord(':'), ord(';'), ord(',')
+_QUOTE, _APOS, _BACKSLASH = ord('"'), ord('\''), ord('\\')
+_SPACE, _UNDERSCORE = ord(' '), ord('_')
+_TAB, _LF, _CR = ord('\t'), ord('\n'), ord('\r')
+_ZERO, _NINE = ord('0'), ord('9')
+_A_LOWER, _Z_LOWER = ord('a'), ord('z')
+_A_UPPER, _Z_UPPER = ord('A'), ord('Z')
+
+def _build_table(entries: dict) -> bytes:
     """
-    Queue-like object inheriting from Deque for fast iteration through text
+    Builds a 256-entry lookup table indexed by character code.
+    :param entries: Mapping of character code to table value, every other code maps to 0.
+    :return: The table as bytes.
     """
-    def __init__(self, data:str = None):
-        super().__init__()
-        if isinstance(data, str):
-            for char in data:
-                self.push(char)
+    table = bytearray(256)
+    for code, value in entries.items():
+        table[code] = value
+    return bytes(table)
+
+#Classes used by BONParser.determine_type, one table entry per character code.
+#0 is skipped, _ALPHA and _DIGIT separate BONNode keys from numbers and
+#anything from _OPENING up is the code of the type opened by the character
+_ALPHA, _DIGIT, _OPENING = 1, 2, 3
+
+#BONType of each code in _TYPE_LUT
+_TYPE_FROM_CODE = (None, None, BONType.number, BONType.bon_object, BONType.bon_list, BONType.string, BONType.bon_node)
+
+#Bytes above 0x7F belong to non-ASCII characters and count as alphabetic
+_TYPE_LUT = _build_table({
+    **{code: _ALPHA for code in [*range(_A_LOWER, _Z_LOWER+1), *range(_A_UPPER, _Z_UPPER+1), _UNDERSCORE, *range(0x80, 0x100)]},
+    **{code: _DIGIT for code in range(_ZERO, _NINE+1)},
+    _LBRACE: _TYPE_FROM_CODE.index(BONType.bon_object),
+    _LBRACK: _TYPE_FROM_CODE.index(BONType.bon_list),
+    _QUOTE: _TYPE_FROM_CODE.index(BONType.string),
+    _APOS: _TYPE_FROM_CODE.index(BONType.string),
+    _COLON: _TYPE_FROM_CODE.index(BONType.bon_node)
+})
+
+#Characters skipped between tokens, 1 for whitespace and 0 otherwise
+_WHITESPACE_LUT = _build_table({code: 1 for code in (_SPACE, _TAB, _LF, _CR)})
 
-    def __str__(self):
-        return "".join([x for x in self])
-
-    def __iter__(self):
-        for x in range(0, len(self)):
-            yield self.peek(x)
+class BONNode():
+    __slots__ = ('key', 'value')
 
-    @property
-    def is_empty(self) -> bool:
-        """
-        Checks if the collection is empty.
-        :return:
-        """
-        return len(self) == 0
+    def __init__(self, key, value):
+        self.key, self.value = key, value
 
-    def peek(self, index = 0) -> str:
-        """
-        Gets a value from the collection without removing it.
-        :param index: Number of chars to peek ahead.
-        :return: A character.
-        """
-        return self[len(self)-(1+ index)] if len(self) > index else None
+    def __str__(self):
+        out = []
+        self._write(out)
+        return "".join(out)
 
-    def push(self, char: str):
+    def _write(self, out: list):
         """
-        Adds a value to the collection.
-        :param char: Single character to add.
+        Appends the text of the node to a buffer of string fragments.
+        :param out: List the fragments are appended to.
         :return: None
         """
-        self.appendleft(char)
-
-class BONNode():
-    def __init__(self, key, value):
-        self.key, self.value = key, value
-
-    def __str__(self):
+        out.append(str(self.key))
+        out.append(": ")
         if isinstance(self.value, list):
-            list_repr = "[{}]".format(", ".join(str(x) for x in self.value))
-            return "{}: {};".format(self.key, list_repr)
+            out.append("[")
+            for index, x in enumerate(self.value):
+                if index:
+                    out.append(", ")
+                _write_value(x, out)
+            out.append("]")
         else:
-            return "{}: {};".format(self.key, self.value)
+            _write_value(self.value, out)
+        out.append(";")
 
     def __contains__(self, item):
         return self.key == item or self.value == item
 
+class BONLazyNode(BONNode):
+    """
+    BONNode whose value is parsed from the source text the first time it is read.
+    The value lives in _value behind the value property, BONNode.__init__ is not called
+    and the inherited 'value' slot stays unused.
+    """
+    __slots__ = ('_parser', '_start', '_end', '_value')
+
+    def __init__(self, key, parser, start: int, end: int):
+        self.key = key
+        self._parser, self._start, self._end = parser, start, end
+
+    @property
+    def value(self):
+        if self._parser is not None:
+            self._value = self._parser._parse_at(self._start, self._end)
+            self._parser = None
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value, self._parser = value, None
+
 class BONObject():
+    __slots__ = ('nodes', '_by_key')
+
+    def __init__(self, nodes:list = None, copy: bool = True):
+        #copy=False shares nodes with the caller instead of copying it, for callers that built the
+        #list just for this object. Lookups by key only see changes made through add_node and del,
+        #so the list must not be changed directly afterwards, whether through nodes or the caller
+        if nodes is None:
+            self.nodes = []
+        elif copy:
+            self.nodes = list(nodes)
+        else:
+            self.nodes = nodes
 
-    def __init__(self, nodes:list = None):
-        self.nodes = nodes[:]
+        #Index of the nodes by key, the first node wins if a key is repeated
+        self._by_key = {}
+        for node in self.nodes:
+            self._by_key.setdefault(node.key, node)
 
     def add_node(self, node: BONNode):
         """
@@ -79,258 +139,419 @@ class BONObject():
         :return: None
         """
         self.nodes.append(node)
+        self._by_key.setdefault(node.key, node)
 
     def __str__(self):
-        base = '{{\n\t{}\n}}'
-
-        values = []
-        print_list = lambda x: "[{}]".format(", ".join(str(y) for y in x))
-
+        out = []
+        self._write(out)
+        return "".join(out)
 
-        for x in self.nodes:
-            values.append(str(x))
-
-        return base.format("\n\t".join(values))
+    def _write(self, out: list):
+        """
+        Appends the text of the object to a buffer of string fragments.
+        :param out: List the fragments are appended to.
+        :return: None
+        """
+        out.append("{\n\t")
+        for index, node in enumerate(self.nodes):
+            if index:
+                out.append("\n\t")
+            node._write(out)
+        out.append("\n}")
 
     def __contains__(self, item):
-        for node in self.nodes:
-            if node.key == item:
-                return True
-        return False
+        return item in self._by_key
 
     def __getitem__(self, item):
-        for node in self.nodes:
-            if node.key == item:
-                return node.value
-
-        raise KeyError(str(item))
+        try:
+            return self._by_key[item].value
+        except KeyError:
+            raise KeyError(str(item))
 
     def __delitem__(self, key):
-        index = None
-        for loop_index, value in enumerate(self.nodes):
-            if value.key == key:
-               index = loop_index
+        node = self._by_key.pop(key)
+        index = next(i for i, other in enumerate(self.nodes) if other is node)
+        del self.nodes[index]
 
-        if not index:
-            raise KeyError
-        else:
-            del self.nodes[index]
+        #the indexed node is the first with its key, so a repeated key can only
+        #follow it and the scan continues from where the node was removed
+        for other in islice(self.nodes, index, None):
+            if other.key == key:
+                self._by_key[key] = other
+                break
 
     def __iter__(self):
         for value in self.nodes:
             yield value
 
+def _write_value(value, out: list):
+    """
+    Appends the text of a value to a buffer of string fragments.
+    :param value: BONNode, BONObject or python value to write.
+    :param out: List the fragments are appended to.
+    :return: None
+    """
+    if isinstance(value, (BONNode, BONObject)):
+        value._write(out)
+    else:
+        out.append(str(value))
+
 class BONParser():
-    opening_map = {
-        '{': BONType.bon_object,
-        '[': BONType.bon_list,
-        '"': BONType.string,
-        '\'':BONType.string,
-        ':': BONType.bon_node
-    }
-    invalid_chars = ('\t', '\n')
-
-    integer_digits = ('0123456789')
-    float_digits = ('0123456789.fe-')
-
-    def __init__(self, data: str):
-        replaced = data.replace('\n', '').replace('\t', '')
-
-        self.text = TextQueue(replaced)
+    escape_pattern = re.compile(r'\\(.)', re.DOTALL)
+    #Run of characters that can make up a number, matched by the C regex engine.
+    #The first group is the leading run of digits, the number is an integer if it spans the whole match
+    number_pattern = re.compile(rb'([0-9]*)[0-9.fe\-]*')
+    #Characters that change the nesting of the text, used to skip over a value without parsing it
+    structure_pattern = re.compile(rb'[;:"\'\[\]{}]')
+    #Characters that have to be escaped inside a string
+    unescaped_pattern = re.compile(rb'[\t\n]')
+
+    def __init__(self, data: str, lazy: bool = False):
+        self.buf = data.encode('utf-8')
+        self.pos = 0
         self.base_object = BONObject
 
+        #If lazy, BONNode values are parsed on first access (see BONLazyNode). Every unread
+        #BONLazyNode keeps this parser, and with it the whole encoded input, in memory
+        #until its value is read or the node is released
+        self.lazy = lazy
+
+        #Parse method for each BONType, indexed by BONType.value
+        self._type_map = (None, self.parse_string, self.parse_number, self.parse_object,
+                          self.parse_list, self.parse_node, self._parse_invalid)
+
+    def _peek(self, k = 0) -> int:
+        """
+        Gets an upcoming character code without consuming it.
+        :param k: Number of chars to peek ahead.
+        :return: A character code, or -1 past the end of the text.
+        """
+        return self.buf[self.pos+k] if self.pos+k < len(self.buf) else -1
+
+    def _skip_ws(self):
+        """
+        Consumes any whitespace before the next character.
+        :return: None
+        """
+        buf = self.buf
+        while self.pos < len(buf) and _WHITESPACE_LUT[buf[self.pos]]:
+            self.pos += 1
+
     def determine_type(self) -> BONType:
         """
-        Determines the type of the upcoming value in the character queue.
+        Determines the type of the upcoming value in the text.
         :return: BONType of the next value.
         """
 
-
-        is_escaped = False
+        buf = self.buf
+        is_escaped = 0
         alpha_found = False
 
-        for char in self.text:
+        for index in range(self.pos, len(buf)):
+            c = buf[index]
             if not is_escaped:
-                #check if char is one of the keys in opening_map
-                if char in self.opening_map:
-                    return self.opening_map[char]
+                code = _TYPE_LUT[c]
+                #check if c opens one of the types in _TYPE_LUT
+                if code >= _OPENING:
+                    return _TYPE_FROM_CODE[code]
 
                 #logic to distinguish between a BONNode key with numeric characters
                 #and a BONType.number
-                elif char.isalpha() and not alpha_found:
+                elif code == _ALPHA:
                     alpha_found = True
-                elif char.isdigit() and not alpha_found:
+                elif code == _DIGIT and not alpha_found:
                     return BONType.number
 
-            is_escaped = (char == '\\' and not is_escaped)
+            #a backslash flips the escape state, any other character clears it
+            is_escaped = (c == _BACKSLASH) & (is_escaped ^ 1)
 
         return BONType.invalid
 
     def parse_value(self):
         """
-        Recursively parses the upcoming character queue
+        Parses the upcoming text
         :return: The parsed result of the next value
         """
-        type = self.determine_type()
-
-        type_map = {
-            BONType.number: self.parse_number,
-            BONType.string: self.parse_string,
-            BONType.bon_node: self.parse_node,
-            BONType.bon_list: self.parse_list,
-            BONType.bon_object: self.parse_object
-        }
+        return self._type_map[self.determine_type().value]()
 
-        return type_map[type]()
+    def _parse_at(self, start: int, end: int):
+        """
+        Parses the value at a position in the text, the cursor is left where it was.
+        :param start: Index of the value in the text.
+        :param end: Index of the ';' token expected after the value.
+        :return: The parsed value
+        """
+        pos = self.pos
+        self.pos = start
+        try:
+            value = self.parse_value()
+            self._skip_ws()
+            if not self.pos == end:
+                raise Exception("Expected token ';' not found.")
+            return value
+        finally:
+            self.pos = pos
+
+    def _parse_invalid(self):
+        """
+        Handles text that does not start any BONType.
+        :raises Exception: Always.
+        """
+        raise Exception("Invalid value, no BONType found.")
 
-    def parse_number(self, data: TextQueue = None):
+    def parse_number(self):
         """
         Parses a number from the upcoming text
-        :param data: TextQueue of the value to parse from (defaults to self.text otherwise)
         :return: The parsed number
         """
-
-        data = self.text if data is None else data
-        buffer = TextQueue()
-
-        while not data.is_empty and (data.peek() in self.float_digits or data.peek() == ' '):
-            buffer.push(data.pop())
-
-        if all((x in self.integer_digits or x == ' ') for x in buffer):
-            return int(str(buffer))
-
-        return self.parse_float(str(buffer))
-
-    def parse_float(self, data: str):
+        self._skip_ws()
+        match = self.number_pattern.match(self.buf, self.pos)
+        self.pos = match.end()
+        token = match.group()
+        is_integer = match.end(1) == self.pos
+
+        try:
+            return int(token) if is_integer else self.parse_float(token)
+        except ValueError:
+            #convert the decoded token again, so the error shows the number as it was written
+            token = token.decode('utf-8')
+            return int(token) if is_integer else self.parse_float(token)
+
+    def parse_float(self, data):
         """
         Parses a BONType.number to a float()."
-        :param data: The BONType.number to parse
+        :param data: The BONType.number to parse, as str or UTF-8 encoded bytes
         :return: A float.
         """
-        if data.count('f') > 1:
+        f = b'f' if isinstance(data, bytes) else 'f'
+
+        #A single 'f' is only allowed as the last character, so the first one found decides
+        f_index = data.find(f)
+        if f_index == -1:
+            return float(data)
+        elif f_index == len(data)-1:
+            return float(data[:-1])
+        elif data.find(f, f_index+1) != -1:
             raise Exception("Float token error: too many tokens present.")
-        elif 'f' in data and data.rindex('f') != len(data)-1:
-            rindex = data.index('f')
-            raise Exception("Float token error: misplaced token.")
         else:
-            return float(data.strip('f'))
+            raise Exception("Float token error: misplaced token.")
 
-    def parse_string(self, data: TextQueue = None) -> str:
+    def parse_string(self) -> str:
         """
-        Parses a string enclosed in '"' characters
-        :param data: TextQueue of the value to parse from (defaults to self.text otherwise)
+        Parses a string enclosed in '"' or "'" characters
         :return: The parsed string.
         """
-        data = self.text if data is None else data
-        buffer = TextQueue()
-        start_found = False
-        is_escaped = False
-
-        #Look for the beginning of the quote, after it is found, start adding the upcoming characters to a new buffer
-        #return the new buffer once the ending quote is found
-        while not data.is_empty:
-            char = data.pop()
-            if start_found and not is_escaped and (char == '"' or char == '\''):
-                return str(buffer)
-            elif start_found and not char in self.invalid_chars:
-                if not char == '\\' or is_escaped:
-                    buffer.push(char)
-            elif char == '"' or char == '\'':
-                start_found = True
-
-            is_escaped = (char == '\\' and not is_escaped)
-
-        raise Exception('Expected token \' " \' not found.')
+        self._skip_ws()
+        quote = self._peek()
+        if not (quote == _QUOTE or quote == _APOS):
+            raise Exception('Expected token \' " \' not found.')
+
+        start = self.pos + 1
+        end = self._find_string_end(start)
+        for match in self.unescaped_pattern.finditer(self.buf, start, end):
+            if not self._is_escaped(match.start(), start):
+                raise Exception('Unescaped tab or line break in string.')
+
+        self.pos = end + 1
+        body = self.buf[start:end].decode('utf-8')
+        return self.escape_pattern.sub(r'\1', body) if '\\' in body else body
+
+    def _find_string_end(self, start: int) -> int:
+        """
+        Finds the closing quote of a string.
+        :param start: Index of the first character after the opening quote.
+        :return: Index of the closing quote.
+        """
+        buf = self.buf
+        quote = buf[start-1]
+        end = start
+
+        #Jump to each candidate closing quote with bytes.find, it ends the string
+        #unless it is preceded by an odd number of backslashes
+        while True:
+            end = buf.find(quote, end)
+            if end == -1:
+                raise Exception('Expected token \' " \' not found.')
+
+            if not self._is_escaped(end, start):
+                return end
+            end += 1
+
+    def _is_escaped(self, index: int, start: int) -> bool:
+        """
+        Checks if a character in a string is escaped.
+        :param index: Index of the character.
+        :param start: Index of the first character after the opening quote.
+        :return: True if the character follows an odd number of backslashes.
+        """
+        buf = self.buf
+        backslash = index
+        while backslash > start and buf[backslash-1] == _BACKSLASH:
+            backslash -= 1
+        return bool((index - backslash) & 1)
 
-    def parse_list(self, data: TextQueue = None) -> list:
+    def _find_node_end(self, start: int) -> int:
+        """
+        Finds the ';' that ends a BONNode without parsing its value.
+        Only the nesting is checked, so for malformed text the error can differ from the
+        one raised when the value is parsed (e.g. a missing ']' reports a missing ';').
+        :param start: Index of the first character of the value.
+        :return: Index of the ';' token.
+        """
+        buf = self.buf
+        pos = start
+        depth = 0
+        #each ':' outside of lists and objects starts a node-valued node, whose ';' comes first
+        pending = 0
+
+        #Jump between structural characters, skip over strings and track the nesting
+        #of lists and objects until the node's own ';' is found outside of them
+        while True:
+            match = self.structure_pattern.search(buf, pos)
+            if match is None:
+                raise Exception("Expected token ';' not found.")
+
+            pos = match.start()
+            c = buf[pos]
+            if c == _QUOTE or c == _APOS:
+                pos = self._find_string_end(pos+1)
+            elif c == _SEMI and depth == 0:
+                if not pending:
+                    return pos
+                pending -= 1
+            elif c == _COLON and depth == 0:
+                pending += 1
+            elif c == _LBRACK or c == _LBRACE:
+                depth += 1
+            elif c == _RBRACK or c == _RBRACE:
+                depth -= 1
+                if depth < 0:
+                    raise Exception("Expected token ';' not found.")
+            pos += 1
+
+    def parse_list(self) -> list:
         """
         Parses a list
-        :param data: TextQueue of the value to parse from (defaults to self.text otherwise)
         :return: A python list
         """
+        return self._parse_nested(BONType.bon_list)
 
-        new_list = []
-        start_found = False
-
-        data = self.text if data is None else data
-
-        #Find the beginning of the list, and once it's found,
-        #call self.parse_value() to extract the sub entires from the list
-        #return once the end token (']') is found
-        while not data.is_empty:
-            char = data.pop()
-
-            if not start_found and char == '[':
-                start_found = True
-
-            if start_found:
-                if char == ',' or char == '[':
-                    new_list.append(self.parse_value())
-                elif char == ']':
-                    return new_list
-                elif not char == ' ':
-                    raise Exception('Malformed list provided')
-
-
-
-    def parse_node(self, data: TextQueue = None) -> BONNode:
+    def parse_node(self) -> BONNode:
         """
         Parses the key and value of a BONNode
-        :param data: TextQueue of the value to parse from (defaults to self.text otherwise)
         :return: The parsed BONNode
         """
-        data = self.text if data is None else data
-        buffer = TextQueue()
-        key, value = None, None
+        return self._parse_nested(BONType.bon_node)
 
-        #Find the key, and then return self.parse_value() to extract the value
-        while not data.is_empty:
-            char = data.pop()
-            if char == ':':
-                key = str(buffer).strip().lstrip()
-                value = self.parse_value()
-            elif char == ';':
-                return BONNode(key, value)
-            elif not char == ' ' and key == None:
-                buffer.push(char)
-
-        raise Exception("Expected token ';' not found.")
-
-
-
-    def parse_object(self, data: TextQueue = None) -> BONObject:
+    def parse_object(self) -> BONObject:
         """
         Parses a BONObject
-        :param data: TextQueue of the value to parse from (defaults to self.text otherwise)
         :return: BONObject containing parsed BONNode objects
         """
-        data = self.text if data is None else data
-        nodes = []
-        start_found = False
-
-        #Once start of object is found, parse BONNodes until the end token ('}') is found
-        while not data.is_empty:
-            char = data.peek()
-            if char == '{':
-                start_found = True
-                char = data.pop()
-                if not self.determine_type() == BONType.bon_node:
-                    raise 'Invalid type, expected BONNode.'
-                nodes.append(self.parse_value())
-            elif char == '}':
-                char = data.pop()
-                return BONObject(nodes)
-            elif start_found and not char == ' ':
-                if not self.determine_type() == BONType.bon_node:
-                    raise 'Invalid type, expected BONNode.'
-                nodes.append(self.parse_value())
-            else:
-                data.pop()
+        return self._parse_nested(BONType.bon_object)
 
-        if not start_found:
-            raise Exception("Expected token '{' not found.")
-        else:
-            raise Exception("Expected token '}' not found")
+    def _parse_nested(self, type: BONType):
+        """
+        Parses a value and everything nested in it without recursion. Lists, objects and nodes
+        that are still being parsed are kept on a stack of (BONType, contents) entries.
+        :param type: BONType of the next value.
+        :return: The parsed value
+        """
+        buf, end = self.buf, len(self.buf)
+        bon_list, bon_object, bon_node = BONType.bon_list, BONType.bon_object, BONType.bon_node
+        stack = []
+
+        while True:
+            #Start the next value. Scalars are parsed right away, lists and objects are pushed
+            #and a node is pushed with its key before moving on to its value.
+            #value is None while the container on top of the stack has just been opened
+            value = None
+            if type is bon_list:
+                self._skip_ws()
+                if not self._peek() == _LBRACK:
+                    raise Exception("Expected token '[' not found.")
+                self.pos += 1
+                stack.append((type, []))
+            elif type is bon_object:
+                #any text ahead of the start of an object is skipped
+                brace = buf.find(_LBRACE, self.pos)
+                if brace == -1:
+                    raise Exception("Expected token '{' not found.")
+                self.pos = brace + 1
+                stack.append((type, []))
+            elif type is bon_node:
+                colon = buf.find(_COLON, self.pos)
+                if colon == -1:
+                    raise Exception("Expected token ':' not found.")
+                key = b''.join(buf[self.pos:colon].split()).decode('utf-8')
+
+                if self.lazy:
+                    node_end = self._find_node_end(colon+1)
+                    self.pos = node_end + 1
+                    value = BONLazyNode(key, self, colon+1, node_end)
+                else:
+                    self.pos = colon+1
+                    stack.append((type, key))
+                    type = self.determine_type()
+                    continue
+            else:
+                value = self._type_map[type.value]()
+
+            #Hand the value to the entry on top of the stack, which either asks for its next value
+            #or is complete and becomes the value handed to the entry below it
+            pos = self.pos
+            while True:
+                if not stack:
+                    self.pos = pos
+                    return value
+
+                entry_type, contents = stack[-1]
+                while pos < end and _WHITESPACE_LUT[buf[pos]]:
+                    pos += 1
+                c = buf[pos] if pos < end else -1
+
+                if entry_type is bon_node:
+                    if not c == _SEMI:
+                        raise Exception("Expected token ';' not found.")
+                    pos += 1
+                    stack.pop()
+                    value = BONNode(contents, value)
+                    continue
+
+                if value is not None:
+                    contents.append(value)
+                    if entry_type is bon_list:
+                        if c == _COMMA:
+                            pos += 1
+                            while pos < end and _WHITESPACE_LUT[buf[pos]]:
+                                pos += 1
+                            c = buf[pos] if pos < end else -1
+                        elif not c == _RBRACK:
+                            raise Exception('Malformed list provided')
+
+                if entry_type is bon_list:
+                    if c == _RBRACK:
+                        pos += 1
+                        stack.pop()
+                        value = contents
+                        continue
+                    elif c == -1:
+                        raise Exception("Expected token ']' not found.")
+                    self.pos = pos
+                    type = self.determine_type()
+                else:
+                    if c == _RBRACE:
+                        pos += 1
+                        stack.pop()
+                        value = BONObject(contents, copy=False)
+                        continue
+                    elif c == -1:
+                        raise Exception("Expected token '}' not found")
+                    self.pos = pos
+                    type = self.determine_type()
+                    if not type is bon_node:
+                        raise Exception('Invalid type, expected BONNode.')
+                break
 
 if __name__ == '__main__':
 
@@ -359,4 +580,10 @@ if __name__ == '__main__':
     print("\n".join(str(value) for value in result))
 
     t = BONParser('value_1: "value";')
-    print(t.parse_value())
\ No newline at end of file
+    print(t.parse_value())
+    print()
+
+    print("Lazy parsing, values are parsed on first access:")
+    lazy_result = BONParser(example, lazy=True).parse_value()
+    print(lazy_result['nested_object']['hello'])
+    print(str(lazy_result) == str(result))
\ No newline at end of file